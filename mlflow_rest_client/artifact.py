@@ -2,11 +2,22 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-from pydantic import AnyUrl, BaseModel  # pylint: disable=no-name-in-module
+from pydantic import (  # pylint: disable=no-name-in-module
+    AnyUrl,
+    BaseModel,
+    PrivateAttr,
+    parse_obj_as,
+)
+
+
+# all artifacts in artifacts list response have the same root, so it is validated only once
+@lru_cache(maxsize=128)
+def _parse_root(root: str) -> AnyUrl:
+    return parse_obj_as(AnyUrl, root)
 
 
 class Artifact(BaseModel):
@@ -39,14 +50,73 @@ class Artifact(BaseModel):
 
     is_dir: bool = False
 
+    # model is frozen, so full path, string representation and hash are computed only once
+    _full_path: Optional[Union[str, Path]] = PrivateAttr(None)
+    _str: Optional[str] = PrivateAttr(None)
+    _hash: Optional[int] = PrivateAttr(None)
+
     class Config:
         frozen = True
 
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        # cached values depend on fields, and copy can change them, e.g. copy(update={"path": ...})
+        artifact = super()._copy_and_set_values(values, fields_set, deep=deep)
+        artifact._init_private_attributes()  # pylint: disable=protected-access
+        return artifact
+
+    @classmethod
+    def from_api(cls, data: dict, root: str | None = None) -> Artifact:
+        """
+        Create artifact from MLflow REST API response without running validation
+
+        Parameters
+        ----------
+        data : dict
+            File info returned by MLflow REST API
+
+        root : str, optional
+            Artifacts root URI
+
+        Returns
+        -------
+        artifact : :obj:`Artifact`
+            Artifact
+
+        Examples
+        --------
+        .. code:: python
+
+            artifact = Artifact.from_api({"path": "some/path", "file_size": 123}, root="s3://some/root")
+        """
+
+        file_size = data.get("file_size")
+        if file_size is None:
+            # let pydantic report incomplete file info the same way as before
+            return cls.parse_obj({**data, "root": root})
+
+        return cls.construct(
+            path=Path(data["path"]),
+            file_size=int(file_size),
+            root=_parse_root(root) if root is not None else None,
+            is_dir=bool(data.get("is_dir", False)),
+        )
+
     @property
     def full_path(self):
-        if self.root:
-            return os.path.join(self.root, self.path)
-        return self.path
+        if self._full_path is None:
+            if self.root:
+                # root is an URL, so join it with "/" on every platform instead of os.path.join
+                self._full_path = self.root.rstrip("/") + "/" + self.path.as_posix()
+            else:
+                self._full_path = self.path
+        return self._full_path
 
     def __str__(self):
-        return self.full_path
+        if self._str is None:
+            self._str = str(self.full_path)
+        return self._str
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self.__class__) + hash(tuple(self.__dict__.values()))
+        return self._hash
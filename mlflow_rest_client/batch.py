@@ -0,0 +1,278 @@
+# SPDX-FileCopyrightText: 2021-2024 MTS (Mobile Telesystems)
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from .run import RunId
+from .timestamp import format_to_timestamp
+
+if TYPE_CHECKING:
+    from .mlflow_rest_client import MLflowRESTClient
+
+log = logging.getLogger(__name__)
+
+
+# buffers, lock and background flush state are all needed, splitting them would not make it simpler
+class RunBatch:  # pylint: disable=too-many-instance-attributes
+    """Buffer for run params, metrics and tags
+
+    Collects separate logging calls and sends them with a single ``runs/log-batch`` request
+    instead of one request per value. Buffer is flushed when it reaches MLflow batch limits,
+    every ``flush_interval`` seconds (if set), on :obj:`flush` or :obj:`close` call and on exit from context manager.
+    Values cannot be added to the batch after it is closed.
+
+    Parameters
+    ----------
+    client : :obj:`mlflow_rest_client.mlflow_rest_client.MLflowRESTClient`
+        Client to send batches with
+
+    run_id : str
+        Run ID
+
+    flush_interval : float, optional
+        If set, buffer is also flushed in background thread every ``flush_interval`` seconds,
+        so values logged in a long loop become visible in MLflow without waiting for the batch to fill up
+
+    Examples
+    --------
+    .. code:: python
+
+        with client.run_batch("some_run_id") as batch:
+            for step in range(100):
+                batch.log_metric("some.metric", 0.1, step=step)
+
+            batch.log_parameter("some.param", "some_value")
+            batch.set_tag("some.tag", "some.value")
+
+        with client.run_batch("some_run_id", flush_interval=5) as batch:
+            for step in range(100000):
+                batch.log_metric("some.metric", 0.1, step=step)
+    """
+
+    MAX_PARAMS = 100
+    """ Maximum number of params in one request """
+
+    MAX_METRICS = 1000
+    """ Maximum number of metrics in one request """
+
+    MAX_TAGS = 100
+    """ Maximum number of tags in one request """
+
+    MAX_ENTITIES = 1000
+    """ Maximum total number of params, metrics and tags in one request """
+
+    def __init__(self, client: MLflowRESTClient, run_id: RunId, flush_interval: float | None = None):
+        self._client = client
+        self._run_id = run_id
+
+        # MLflow rejects batches with duplicated param keys, so only the last value of each param is kept
+        self._params: dict[str, dict] = {}
+        self._metrics: list[dict] = []
+        self._tags: list[dict] = []
+
+        # batch can be filled from several threads, e.g. data loader and training loop
+        self._lock = threading.Lock()
+
+        self._closed = threading.Event()
+        self._flush_error: Exception | None = None
+        self._flush_thread: threading.Thread | None = None
+        if flush_interval:
+            self._flush_thread = threading.Thread(target=self._flush_periodically, args=(flush_interval,), daemon=True)
+            self._flush_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+
+        # buffered values are still sent, but flush error should not hide the original exception
+        try:
+            self.close()
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Cannot flush batch on exit")
+
+    def __len__(self):
+        return len(self._params) + len(self._metrics) + len(self._tags)
+
+    def __bool__(self):
+        # batch object is truthy even if it is empty, ``len(batch)`` is the number of buffered values
+        return True
+
+    def log_parameter(self, key: str, value: str) -> None:
+        """
+        Add run parameter to the batch
+
+        Parameters
+        ----------
+        key : str
+            Parameter name
+
+        value : str
+            Parameter value
+
+        Examples
+        --------
+        .. code:: python
+
+            batch.log_parameter("some.param", "some_value")
+        """
+
+        with self._lock:
+            self._check_not_closed()
+            self._params[key] = {"key": key, "value": value}
+            self._flush_if_full()
+
+    def log_metric(
+        self,
+        key: str,
+        value: float,
+        step: int = 0,
+        timestamp: int | datetime | None = None,
+    ) -> None:
+        """
+        Add run metric value to the batch
+
+        Parameters
+        ----------
+        key : str
+            Metric name
+
+        value : float
+            Metric value
+
+        step : int, optional
+            Metric step (default: 0)
+
+        timestamp : :obj:`int` or :obj:`datetime.datetime`, optional
+            Metric timestamp, current time is used if not set
+
+        Examples
+        --------
+        .. code:: python
+
+            batch.log_metric("some.metric", 123)
+            batch.log_metric("some.metric", 123, step=2)
+            batch.log_metric("some.metric", 123, timestamp=datetime.datetime.now())
+        """
+
+        # timestamp is calculated here, otherwise all metrics in batch will get the time of flush
+        metric = {"key": key, "value": value, "step": int(step), "timestamp": format_to_timestamp(timestamp)}
+        with self._lock:
+            self._check_not_closed()
+            self._metrics.append(metric)
+            self._flush_if_full()
+
+    def set_tag(self, key: str, value: str) -> None:
+        """
+        Add run tag to the batch
+
+        Parameters
+        ----------
+        key : str
+            Tag name
+
+        value : str
+            Tag value
+
+        Examples
+        --------
+        .. code:: python
+
+            batch.set_tag("some.tag", "some.value")
+        """
+
+        with self._lock:
+            self._check_not_closed()
+            self._tags.append({"key": key, "value": value})
+            self._flush_if_full()
+
+    def flush(self) -> None:
+        """
+        Send all buffered values to MLflow
+
+        Does nothing if batch is empty
+
+        Examples
+        --------
+        .. code:: python
+
+            batch.flush()
+        """
+
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """
+        Stop background flushing (if any) and send all buffered values to MLflow
+
+        If some background flush failed, its error is raised after sending the values,
+        even if they were sent successfully by the next flush
+
+        Examples
+        --------
+        .. code:: python
+
+            batch = client.run_batch("some_run_id", flush_interval=5)
+            ...
+            batch.close()
+        """
+
+        self._closed.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+
+        self.flush()
+
+        if self._flush_error is not None:
+            error, self._flush_error = self._flush_error, None
+            raise error
+
+    def _flush_periodically(self, flush_interval: float) -> None:
+        while not self._closed.wait(flush_interval):
+            try:
+                self.flush()
+            except Exception as e:  # pylint: disable=broad-except
+                # values are kept in the buffer, so they are sent again on next flush,
+                # and the error is raised by close() to let caller know that something went wrong
+                self._flush_error = e
+                log.exception("Cannot flush batch for run %s", self._run_id)  # pylint: disable=logging-too-many-args
+
+    def _check_not_closed(self) -> None:
+        # values added after close are never sent, so they are rejected instead of being lost silently
+        if self._closed.is_set():
+            raise RuntimeError(f"Batch for run {self._run_id} is already closed")
+
+    def _flush_if_full(self) -> None:
+        if (
+            len(self._params) >= self.MAX_PARAMS
+            or len(self._metrics) >= self.MAX_METRICS
+            or len(self._tags) >= self.MAX_TAGS
+            or len(self) >= self.MAX_ENTITIES
+        ):
+            self._flush()
+
+    def _flush(self) -> None:
+        # buffer can exceed MLflow limits after failed flush, so it is sent in several requests
+        while self._params or self._metrics or self._tags:
+            params = list(islice(self._params.values(), self.MAX_PARAMS))
+            free = self.MAX_ENTITIES - len(params)
+            metrics = self._metrics[: min(self.MAX_METRICS, free)]
+            free -= len(metrics)
+            tags = self._tags[: min(self.MAX_TAGS, free)]
+
+            self._client.log_run_batch(self._run_id, params=params, metrics=metrics, tags=tags)
+
+            # only values which were sent are removed, the rest is sent by the next request or on next flush
+            for param in params:
+                del self._params[param["key"]]
+            del self._metrics[: len(metrics)]
+            del self._tags[: len(tags)]
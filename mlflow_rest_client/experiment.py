@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import List
 
-from pydantic import BaseModel, Field  # pylint: disable=no-name-in-module
+from pydantic import BaseModel, Field, validator  # pylint: disable=no-name-in-module
 
 from .internal import ListableBase
 from .tag import Tag
@@ -22,6 +22,11 @@ class ExperimentStage(Enum):
     """ Experiment was deleted"""
 
 
+# REST API returns lowercase stage names, but older clients used uppercase ones
+_STAGE_CACHE = {stage.value: stage for stage in ExperimentStage}
+_STAGE_CACHE.update({stage.value.upper(): stage for stage in ExperimentStage})
+
+
 # pylint: disable=too-many-ancestors
 class ExperimentTag(Tag):
     """Experiment tag
@@ -107,5 +112,50 @@ class Experiment(BaseModel):
     class Config:
         frozen = True
 
+    @validator("stage", pre=True)
+    def validate_stage(cls, val):  # pylint: disable=no-self-argument
+        if val is None:
+            return ExperimentStage.ACTIVE
+
+        return _STAGE_CACHE.get(val, val)
+
+    @classmethod
+    def from_api(cls, data: dict) -> Experiment:
+        """
+        Create experiment from MLflow REST API response without running validation
+
+        Response is trusted to match MLflow schema, so fields are converted manually
+        and the model is built with ``construct``, which is much faster than ``parse_obj``.
+
+        Parameters
+        ----------
+        data : dict
+            Experiment representation returned by MLflow REST API
+
+        Returns
+        -------
+        experiment : :obj:`Experiment`
+            Experiment
+
+        Examples
+        --------
+        .. code:: python
+
+            experiment = Experiment.from_api({"experiment_id": "123", "name": "some_name"})
+        """
+
+        stage = data.get("lifecycle_stage") or data.get("stage")
+        tags = [ExperimentTag.construct(key=tag["key"], value=tag.get("value", "")) for tag in data.get("tags") or []]
+
+        experiment_id = data["experiment_id"] if "experiment_id" in data else data["id"]
+
+        return cls.construct(
+            id=int(experiment_id),
+            name=data["name"],
+            artifact_location=data.get("artifact_location") or "",
+            stage=(_STAGE_CACHE.get(stage) or ExperimentStage(stage)) if stage else ExperimentStage.ACTIVE,
+            tags=ListExperimentTags.construct(__root__=tags),
+        )
+
     def __str__(self):
         return self.name
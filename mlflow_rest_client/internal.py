@@ -2,9 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List
 
-from pydantic import BaseModel  # pylint: disable=no-name-in-module
+from pydantic import BaseModel, PrivateAttr  # pylint: disable=no-name-in-module
 
 from .tag import Tag
 
@@ -12,25 +12,43 @@ from .tag import Tag
 class ListableBase(BaseModel):
     __root__: list
 
+    # list is frozen, so lookup indexes are built on first use and invalidated only on copy
+    _indexes: Dict[str, Dict[Any, Any]] = PrivateAttr(default_factory=dict)
+
     class Config:
         frozen = True
 
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        # copy can replace items, e.g. copy(update={"__root__": [...]}), so it gets its own empty indexes
+        listable = super()._copy_and_set_values(values, fields_set, deep=deep)
+        listable._init_private_attributes()  # pylint: disable=protected-access
+        return listable
+
+    def _index(self, attr: str) -> dict:
+        index = self._indexes.get(attr)
+        if index is None:
+            index = {getattr(item, attr): item for item in self.__root__}
+            self._indexes[attr] = index
+        return index
+
     @property
     def as_dict(self):
-        return {item.key: item for item in self.__root__}
+        return self._index("key")
 
     def __iter__(self):
         return iter(self.__root__)
 
     def __getitem__(self, item):
-        if isinstance(item, str) and self.as_dict:
-            return self.as_dict[item]
+        if isinstance(item, str):
+            items = self.as_dict
+            if items:
+                return items[item]
 
         return self.__root__[item]
 
     def __contains__(self, item):
         if isinstance(item, str):
-            return any(i.key == item for i in self.__root__)
+            return item in self.as_dict
 
         return item in self.__root__
 
@@ -43,7 +61,6 @@ class ListableTag(ListableBase):
 
     def __getitem__(self, item):
         if isinstance(item, str):
-            res = {i.key: i for i in self.__root__}
-            return res[item]
+            return self.as_dict[item]
 
         return super().__getitem__(item)
@@ -4,17 +4,22 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Iterator, List
+from typing import Any, Callable, Iterator
 from uuid import UUID
 
 import requests
 import urllib3
-from pydantic import parse_obj_as  # pylint: disable=no-name-in-module
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .artifact import Artifact
-from .experiment import Experiment
+from .batch import RunBatch
+from .experiment import Experiment, ExperimentStage
 from .model import (
     ListableModelVersion,
     Model,
@@ -27,11 +32,59 @@ from .run import Metric, Run, RunId, RunInfo, RunStatus, RunViewType
 from .tag import Tag, TagsListOrDict
 from .timestamp import current_timestamp, format_to_timestamp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 log = logging.getLogger(__name__)
 
 
+def _json_loads(content: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson does not accept NaN and Infinity, but MLflow returns them as metric values
+            pass
+
+    return json.loads(content)
+
+
+def _json_default(value: Any) -> Any:
+    # same error as stdlib json raises for types it cannot serialize
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _has_non_finite_metrics(body: Any) -> bool:
+    # metric values are the only float fields of request bodies, so only they are checked
+    # instead of walking through the whole body
+    if not isinstance(body, dict):
+        return False
+
+    values = [metric.get("value") for metric in body.get("metrics") or () if isinstance(metric, dict)]
+    values.append(body.get("value"))
+    return any(isinstance(value, float) and not math.isfinite(value) for value in values)
+
+
+def _json_dumps(body: Any) -> bytes | None:
+    # orjson writes NaN and Infinity as null, while requests rejects them.
+    # Such bodies, and bodies which cannot be serialized by orjson, are left to requests to keep its behavior
+    if orjson is None or _has_non_finite_metrics(body):
+        return None
+
+    try:
+        return orjson.dumps(
+            body,
+            default=_json_default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS,
+        )
+    except orjson.JSONEncodeError:
+        return None
+
+
 # pylint: disable=too-many-public-methods
 class MLflowRESTClient:
     """Client for MLflow REST API
@@ -56,6 +109,11 @@ class MLflowRESTClient:
     ignore_ssl_check : bool
         If `True`, skip SSL verify step
 
+    pool_maxsize : int, optional
+        Maximum number of keep-alive connections to MLflow host (default: :obj:`POOL_MAXSIZE`)
+
+        Should be not less than number of threads using the same client
+
     Examples
     --------
     .. code:: python
@@ -74,10 +132,32 @@ class MLflowRESTClient:
             url="http://some.domain:5000",
             ignore_ssl_check=True,
         )
+        client_with_big_pool = MLflowRESTClient(
+            url="http://some.domain:5000",
+            pool_maxsize=128,
+        )
     """
 
     MAX_RESULTS = 100
 
+    POOL_CONNECTIONS = 16
+    """ Number of connection pools to cache """
+
+    POOL_MAXSIZE = 64
+    """ Maximum number of keep-alive connections per host """
+
+    MAX_WORKERS = 8
+    """ Maximum number of parallel requests sent by a single method call, like :obj:`delete_run_tags` """
+
+    MAX_RETRIES = 3
+    """ Number of retries of idempotent requests failed with connection error or server overload """
+
+    RETRY_STATUSES = (429, 502, 503, 504)
+    """ Response statuses which should be retried """
+
+    JSON_HEADERS = {"Content-Type": "application/json"}
+    """ Headers of request with body already serialized to JSON """
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -86,8 +166,11 @@ class MLflowRESTClient:
         password: str | None = None,
         token: str | None = None,
         ignore_ssl_check: bool = False,
+        pool_maxsize: int | None = None,
     ):
         self._base_url = api_url
+        # URL prefix is the same for all endpoints, so it is built only once
+        self._api_url = f"{api_url}/api/2.0/preview/mlflow/"
         self._session = requests.Session()
         self._session.verify = not ignore_ssl_check
         if user and password:
@@ -95,10 +178,45 @@ class MLflowRESTClient:
         elif token:
             self._session.headers.update({"Authorization": f"Bearer {token}"})
 
+        # only idempotent methods (GET, PUT, etc) are retried, POST requests could create duplicated entities.
+        # DELETE is not retried either: if the response of successful request was lost, retry would fail with 404.
+        # last response is returned instead of raising urllib3 exception, so raise_for_status works as before
+        retries = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS - {"DELETE"},
+            raise_on_status=False,
+        )
+
+        # keep connections alive between calls instead of doing a new TCP/TLS handshake for each request
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or self.POOL_MAXSIZE,
+            max_retries=retries,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close all opened connections
+
+        Examples
+        --------
+        .. code:: python
+
+            client = MLflowRESTClient(url="http://some.domain:5000")
+            ...
+            client.close()
+        """
+
         self._session.close()
 
     def list_experiments(self, view_type: RunViewType = RunViewType.ACTIVE) -> list[Experiment]:
@@ -123,21 +241,31 @@ class MLflowRESTClient:
 
         """
 
-        data = parse_obj_as(
-            List[Experiment],
-            self._get("experiments/list", view_type=view_type.value).get("experiments", []),
-        )
-        return data
+        return self._list_experiments_page(view_type).items
 
-    def list_experiments_iterator(self, view_type: RunViewType = RunViewType.ACTIVE) -> Iterator[Experiment]:
+    def list_experiments_iterator(
+        self,
+        view_type: RunViewType = RunViewType.ACTIVE,
+        max_results: int | None = None,
+        page_token: str | None = None,
+    ) -> Iterator[Experiment]:
         """
         Iterate by all existing experiments in MLflow database
 
+        If ``max_results`` is set, experiments are fetched page by page while iteration,
+        otherwise all of them are fetched with a single request.
+
         Parameters
         ----------
         view_type : :obj:`mlflow_rest_client.run.RunViewType`, optional
             View type
 
+        max_results : int, optional
+            Max results to return in one page
+
+        page_token : str, optional
+            Previous page token, to start search from next page
+
         Returns
         -------
         experiments_iterator: :obj:`Iterator` of :obj:`mlflow_rest_client.experiment.Experiment`
@@ -149,10 +277,31 @@ class MLflowRESTClient:
 
             for experiment in client.list_experiments_iterator():
                 print(experiment)
+
+            for experiment in client.list_experiments_iterator(max_results=1000):
+                print(experiment)
         """
 
-        experiments = self.list_experiments(view_type=view_type)
-        yield from experiments
+        yield from self._paginate(
+            lambda token: self._list_experiments_page(view_type, max_results=max_results, page_token=token),
+            page_token,
+        )
+
+    def _list_experiments_page(
+        self,
+        view_type: RunViewType,
+        max_results: int | None = None,
+        page_token: str | None = None,
+    ) -> Page:
+        params: dict[str, Any] = {"view_type": view_type.value}
+        if max_results:
+            params["max_results"] = max_results
+        if page_token:
+            params["page_token"] = page_token
+
+        response = self._get("experiments/list", **params)
+        items = [Experiment.from_api(item) for item in response.get("experiments", [])]
+        return Page(items=items, next_page_token=response.get("next_page_token"))
 
     def get_experiment(self, experiment_id: int) -> Experiment:
         """
@@ -175,8 +324,8 @@ class MLflowRESTClient:
             experiment = client.get_experiment(123)
         """
 
-        data = self._get("experiments/get", experiment_id=experiment_id).get("experiment")
-        return Experiment.parse_obj(data)
+        data = self._get("experiments/get", experiment_id=experiment_id)["experiment"]
+        return Experiment.from_api(data)
 
     def get_experiment_by_name(self, name: str) -> Experiment | None:
         """
@@ -199,9 +348,29 @@ class MLflowRESTClient:
             experiment = client.get_experiment_by_name("some_experiment")
         """
 
-        experiment_id = self.get_experiment_id(name)
-        if experiment_id:
-            return self.get_experiment(experiment_id)
+        try:
+            data = self._get("experiments/get-by-name", experiment_name=name)["experiment"]
+        except requests.HTTPError as e:
+            error_code = self._error_code(e)
+            if error_code == "RESOURCE_DOES_NOT_EXIST":
+                return None
+
+            if error_code or e.response is None or e.response.status_code not in {404, 405, 501}:
+                raise
+
+            # MLflow server is too old to have this endpoint
+            return self._find_experiment_by_name(name)
+
+        experiment = Experiment.from_api(data)
+        # deleted experiments are not returned by experiments/list, keep the same behavior here
+        if experiment.stage != ExperimentStage.ACTIVE:
+            return None
+        return experiment
+
+    def _find_experiment_by_name(self, name: str) -> Experiment | None:
+        for experiment in self.list_experiments():
+            if experiment.name == name:
+                return experiment
         return None
 
     def create_experiment(self, name: str, artifact_location: str | None = None) -> Experiment:
@@ -230,11 +399,11 @@ class MLflowRESTClient:
             experiment = client.create_experiment("some_experiment", artifact_location="some/path")
         """
 
-        params: dict[str, str] = {}
+        body: dict[str, str] = {"name": name}
         if artifact_location:
-            params["artifact_location"] = artifact_location
+            body["artifact_location"] = artifact_location
 
-        experiment_id = self._post("experiments/create", name=name, **params).get("experiment_id")
+        experiment_id = self._post("experiments/create", body).get("experiment_id")
         return self.get_experiment(experiment_id)  # type: ignore[arg-type]
 
     def rename_experiment(self, experiment_id: int, new_name: str) -> None:
@@ -339,10 +508,9 @@ class MLflowRESTClient:
             experiment_id = client.get_experiment_id("some_experiment")
         """
 
-        exps = self.list_experiments()
-        for exp in exps:
-            if exp.name == name:
-                return exp.id
+        experiment = self.get_experiment_by_name(name)
+        if experiment:
+            return experiment.id
         return None
 
     def get_or_create_experiment(self, name: str, artifact_location: str | None = None) -> Experiment:
@@ -369,11 +537,24 @@ class MLflowRESTClient:
             experiment = client.get_or_create_experiment("some_experiment")
         """
 
-        experiment_id = self.get_experiment_id(name)
-        if experiment_id is not None:
-            return self.get_experiment(experiment_id)
+        # experiment usually exists already, so it is fetched first
+        experiment = self.get_experiment_by_name(name)
+        if experiment:
+            return experiment
+
+        try:
+            return self.create_experiment(name, artifact_location)
+        except requests.HTTPError as e:
+            if self._error_code(e) != "RESOURCE_ALREADY_EXISTS":
+                raise
 
-        return self.create_experiment(name, artifact_location)
+            # experiment was created by a concurrent caller after the lookup
+            experiment = self.get_experiment_by_name(name)
+            if not experiment:
+                # name is taken by a deleted experiment
+                raise
+
+            return experiment
 
     def list_experiment_runs(self, experiment_id: int) -> list[Run]:
         """
@@ -396,8 +577,8 @@ class MLflowRESTClient:
             runs = client.list_experiment_runs(123)
         """
 
-        data = list(self.list_experiment_runs_iterator(experiment_id))
-        return parse_obj_as(List[Run], data)
+        # items are already parsed, validating them again only makes a copy of each run
+        return list(self.list_experiment_runs_iterator(experiment_id))
 
     def list_experiment_runs_iterator(self, experiment_id: int) -> Iterator:
         """
@@ -444,7 +625,7 @@ class MLflowRESTClient:
             run = client.get_run("some_run_id")
         """
 
-        return Run.parse_obj(self._get("runs/get", run_id=UUID(str(run_id)).hex).get("run"))
+        return Run.from_api(self._get("runs/get", run_id=UUID(str(run_id)).hex)["run"])
 
     def create_run(
         self,
@@ -495,8 +676,8 @@ class MLflowRESTClient:
             experiment_id=experiment_id,
             start_time=format_to_timestamp(start_time),
             tags=tags_list,
-        ).get("run")
-        return Run.parse_obj(data)
+        )["run"]
+        return Run.from_api(data)
 
     def set_run_status(
         self,
@@ -534,11 +715,11 @@ class MLflowRESTClient:
             )
         """
 
-        params: dict[str, Any] = {"status": RunStatus(status).value}
+        body: dict[str, Any] = {"run_id": UUID(str(run_id)).hex, "status": RunStatus(status).value}
         if end_time:
-            params["end_time"] = format_to_timestamp(end_time)
+            body["end_time"] = format_to_timestamp(end_time)
 
-        return RunInfo.parse_obj(self._post("runs/update", run_id=UUID(str(run_id)).hex, **params).get("run_info"))
+        return RunInfo.from_api(self._post("runs/update", body)["run_info"])
 
     def start_run(self, run_id: RunId) -> RunInfo:
         """
@@ -753,8 +934,7 @@ class MLflowRESTClient:
             client.log_run_parameters("some_run_id", params)
         """
 
-        params_list = self._handle_tags(params)
-        self.log_run_batch(run_id=run_id, params=params_list)
+        self.log_run_batch(run_id=run_id, params=params)
 
     def log_run_metric(
         self,
@@ -798,11 +978,16 @@ class MLflowRESTClient:
         if not timestamp:
             timestamp = current_timestamp()
 
-        dct = self._add_timestamp(
-            {"run_id": UUID(str(run_id)).hex, "key": key, "value": value, "step": int(step)},
-            format_to_timestamp(timestamp),
+        self._post(
+            "runs/log-metric",
+            {
+                "run_id": UUID(str(run_id)).hex,
+                "key": key,
+                "value": value,
+                "step": int(step),
+                "timestamp": format_to_timestamp(timestamp),
+            },
         )
-        self._post("runs/log-metric", **dct)
 
     def log_run_metrics(
         self,
@@ -836,13 +1021,7 @@ class MLflowRESTClient:
             client.log_run_metrics("some_run_id", metrics)
         """
 
-        if not timestamp:
-            timestamp = current_timestamp()
-
-        metrics_list = [
-            self._add_timestamp(metric, format_to_timestamp(timestamp)) for metric in self._handle_tags(metrics)
-        ]
-        self.log_run_batch(run_id=run_id, metrics=metrics_list)
+        self.log_run_batch(run_id=run_id, metrics=metrics, timestamp=timestamp)
 
     def log_run_batch(
         self,
@@ -867,7 +1046,8 @@ class MLflowRESTClient:
             Metrics list
 
         timestamp : :obj:`int` or :obj:`datetime.datetime`, optional
-            Run tags Default timestamp for metric
+            Default timestamp for metrics without their own timestamp.
+            Metric timestamps passed as :obj:`datetime.datetime` or :obj:`float` are converted to :obj:`int`
 
         tags : :obj:`dict` or :obj:`list` of :obj:`dict`, optional
             Run tags list
@@ -902,17 +1082,59 @@ class MLflowRESTClient:
 
         if not timestamp:
             timestamp = current_timestamp()
-
-        metrics_list = [
-            self._add_timestamp(metric, format_to_timestamp(timestamp)) for metric in self._handle_tags(metrics)
-        ]
+        default_timestamp = format_to_timestamp(timestamp)
+
+        metrics_list = []
+        for metric in self._handle_tags(metrics):
+            metric_timestamp = metric.get("timestamp")
+            if not isinstance(metric_timestamp, int):
+                # metrics passed by user are not modified in place
+                metric_timestamp = format_to_timestamp(metric_timestamp) if metric_timestamp else default_timestamp
+                metric = {**metric, "timestamp": metric_timestamp}
+            metrics_list.append(metric)
         params_list = self._handle_tags(params)
         tags_list = self._handle_tags(tags)
 
         self._post(
-            "runs/log-batch", run_id=UUID(str(run_id)).hex, params=params_list, metrics=metrics_list, tags=tags_list
+            "runs/log-batch",
+            {"run_id": UUID(str(run_id)).hex, "params": params_list, "metrics": metrics_list, "tags": tags_list},
         )
 
+    def run_batch(self, run_id: RunId, flush_interval: float | None = None) -> RunBatch:
+        """
+        Create buffer which sends run params, metrics and tags with a single request
+
+        Parameters
+        ----------
+        run_id : UUID
+            Run ID
+
+        flush_interval : float, optional
+            If set, buffer is also flushed in background every ``flush_interval`` seconds
+
+        Returns
+        -------
+        batch : :obj:`mlflow_rest_client.batch.RunBatch`
+            Run batch, flushed on exit from context manager
+
+        Examples
+        --------
+        .. code:: python
+
+            with client.run_batch("some_run_id") as batch:
+                for step in range(100):
+                    batch.log_metric("some.metric", 0.1, step=step)
+
+                batch.log_parameter("some.param", "some_value")
+                batch.set_tag("some.tag", "some.value")
+
+            with client.run_batch("some_run_id", flush_interval=5) as batch:
+                for step in range(100000):
+                    batch.log_metric("some.metric", 0.1, step=step)
+        """
+
+        return RunBatch(self, run_id, flush_interval=flush_interval)
+
     def log_run_model(self, run_id: RunId, model: dict) -> None:
         """
         Add or update run model description
@@ -988,8 +1210,7 @@ class MLflowRESTClient:
             client.set_run_tags("some_run_id", run_tags)
         """
 
-        tags_list = self._handle_tags(tags)
-        self.log_run_batch(run_id=run_id, tags=tags_list)
+        self.log_run_batch(run_id=run_id, tags=tags)
 
     def delete_run_tag(self, run_id: RunId, key: str) -> None:
         """
@@ -1035,25 +1256,20 @@ class MLflowRESTClient:
             client.delete_run_tags("some_run_id", run_tags)
         """
 
+        keys_list: list[str] = []
         if isinstance(keys, dict):
-            for key in keys:
-                self.delete_run_tag(run_id, key)
+            keys_list = list(keys)
         elif isinstance(keys, list):
             for tag in keys:
                 if isinstance(tag, str):
-                    self.delete_run_tag(run_id, tag)
+                    keys_list.append(tag)
                 elif isinstance(tag, Tag):
-                    self.delete_run_tag(run_id, tag.key)
+                    keys_list.append(tag.key)
                 elif isinstance(tag, dict) and "key" in tag:
-                    self.delete_run_tag(run_id, tag["key"])
-
-    @staticmethod
-    def _add_timestamp(item: dict, timestamp: int) -> dict:
-        if "timestamp" in item and isinstance(item["timestamp"], int):
-            return item
+                    keys_list.append(tag["key"])
 
-        item["timestamp"] = timestamp
-        return item
+        # there is no endpoint for deleting multiple tags, so send requests in parallel
+        self._map_concurrently(lambda key: self.delete_run_tag(run_id, key), keys_list)
 
     def list_run_metric_history(self, run_id: RunId, key: str) -> list[Metric]:
         """
@@ -1079,15 +1295,22 @@ class MLflowRESTClient:
             metrics_list = client.list_run_metric_history("some_run_id", "some.metric")
         """
 
-        return parse_obj_as(
-            List[Metric],
-            self._get("metrics/get-history", run_id=UUID(str(run_id)).hex, metric_key=key).get("metrics"),
-        )
+        return self._list_run_metric_history_page(run_id, key).items
 
-    def list_run_metric_history_iterator(self, run_id: RunId, key: str) -> Iterator[Metric]:
+    def list_run_metric_history_iterator(
+        self,
+        run_id: RunId,
+        key: str,
+        max_results: int | None = None,
+        page_token: str | None = None,
+    ) -> Iterator[Metric]:
         """
         Iterate by metric history
 
+        If ``max_results`` is set, metric history is fetched page by page while iteration,
+        so long histories are not loaded into memory at once.
+        Otherwise all values are fetched with a single request.
+
         Parameters
         ----------
         run_id : str
@@ -1096,6 +1319,12 @@ class MLflowRESTClient:
         key : str
             Metric name
 
+        max_results : int, optional
+            Max results to return in one page
+
+        page_token : str, optional
+            Previous page token, to start search from next page
+
         Returns
         -------
         metrics: :obj:`Iterator` of :obj:`mlflow_rest_client.run.Metric`
@@ -1107,9 +1336,34 @@ class MLflowRESTClient:
 
             for metric in client.list_run_metric_history_iterator("some_run_id", "some.metric"):
                 print(metric)
+
+            for metric in client.list_run_metric_history_iterator(
+                "some_run_id", "some.metric", max_results=1000
+            ):
+                print(metric)
         """
 
-        yield from self.list_run_metric_history(run_id, key)
+        yield from self._paginate(
+            lambda token: self._list_run_metric_history_page(run_id, key, max_results=max_results, page_token=token),
+            page_token,
+        )
+
+    def _list_run_metric_history_page(
+        self,
+        run_id: RunId,
+        key: str,
+        max_results: int | None = None,
+        page_token: str | None = None,
+    ) -> Page:
+        params: dict[str, Any] = {}
+        if max_results:
+            params["max_results"] = max_results
+        if page_token:
+            params["page_token"] = page_token
+
+        response = self._get("metrics/get-history", run_id=UUID(str(run_id)).hex, metric_key=key, **params)
+        items = [Metric.from_api(item) for item in response.get("metrics", [])]
+        return Page(items=items, next_page_token=response.get("next_page_token"))
 
     def list_run_artifacts(self, run_id: RunId, path: str | None = None, page_token: str | None = None) -> Page:
         """
@@ -1147,7 +1401,9 @@ class MLflowRESTClient:
             params["page_token"] = page_token
         response = self._get("artifacts/list", run_id=UUID(str(run_id)).hex, **params)
 
-        return Page.make(response, items_key="files", item_class=Artifact, root=response["root_uri"])
+        root = response["root_uri"]
+        items = [Artifact.from_api(item, root=root) for item in response.get("files", [])]
+        return Page(items=items, next_page_token=response.get("next_page_token"))
 
     def list_run_artifacts_iterator(
         self,
@@ -1193,13 +1449,10 @@ class MLflowRESTClient:
                 print(artifact)
         """
 
-        page = self.list_run_artifacts(run_id=run_id, path=path, page_token=page_token)
-        while True:
-            yield from page
-            if page.has_next_page:
-                page = self.list_run_artifacts(run_id=run_id, path=path, page_token=page.next_page_token)
-            else:
-                break
+        yield from self._paginate(
+            lambda token: self.list_run_artifacts(run_id=run_id, path=path, page_token=token),
+            page_token,
+        )
 
     def search_runs(
         self,
@@ -1209,6 +1462,7 @@ class MLflowRESTClient:
         max_results: int = MAX_RESULTS,
         order_by: list[str] | None = None,
         page_token: str | None = None,
+        info_only: bool = False,
     ) -> Page:
         """
         Search for runs
@@ -1233,10 +1487,13 @@ class MLflowRESTClient:
         page_token : str, optional
             Previous page token, to start search from next page
 
+        info_only : bool, optional
+            If `True`, parse only run info and skip run params, metrics and tags
+
         Returns
         -------
         runs_page: :obj:`mlflow_rest_client.page.Page` of :obj:`mlflow_rest_client.run.Run`
-            Runs page
+            Runs page, or page of :obj:`mlflow_rest_client.run.RunInfo` if ``info_only`` is `True`
 
         Examples
         --------
@@ -1255,6 +1512,8 @@ class MLflowRESTClient:
             runs_page = client.search_runs(experiment_ids, run_view_type=RunViewType.ALL)
             runs_page = client.search_runs(experiment_ids, max_results=100)
             runs_page = client.search_runs(experiment_ids, page_token="next_page_id")
+
+            run_infos_page = client.search_runs(experiment_ids, info_only=True)
         """
 
         if not isinstance(experiment_ids, list):
@@ -1271,8 +1530,14 @@ class MLflowRESTClient:
         }
         if page_token:
             params["page_token"] = page_token
-        response = self._post("runs/search", **params)
-        return Page.make(response, items_key="runs", item_class=Run)
+        response = self._post("runs/search", params)
+        if info_only:
+            # params, metrics and tags are the largest part of the response, do not parse them at all
+            items = [RunInfo.from_api(run["info"]) for run in response.get("runs", [])]
+        else:
+            items = [Run.from_api(run) for run in response.get("runs", [])]
+
+        return Page(items=items, next_page_token=response.get("next_page_token"))
 
     def search_runs_iterator(
         self,
@@ -1282,6 +1547,7 @@ class MLflowRESTClient:
         max_results: int = MAX_RESULTS,
         order_by: list[str] | None = None,
         page_token: str | None = None,
+        info_only: bool = False,
     ) -> Iterator[Run]:
         """
         Iterate by runs
@@ -1308,9 +1574,12 @@ class MLflowRESTClient:
         page_token : str, optional
             Previous page token, to start search from next page
 
+        info_only : bool, optional
+            If `True`, parse only run info and skip run params, metrics and tags
+
         Returns
         -------
-        runs: :obj:`Iterator` of :obj:`mlflow_rest_client.run.Run`
+        runs: :obj:`Iterator` of :obj:`mlflow_rest_client.run.Run` or :obj:`mlflow_rest_client.run.RunInfo`
             Runs iterator
 
         Examples
@@ -1338,29 +1607,23 @@ class MLflowRESTClient:
 
             for run in client.search_runs_iterator(experiment_ids, page_token="next_page_id"):
                 print(run)
-        """
 
-        page = self.search_runs(
-            experiment_ids=experiment_ids,
-            query=query,
-            run_view_type=run_view_type,
-            max_results=max_results,
-            order_by=order_by,
-            page_token=page_token,
+            for run_info in client.search_runs_iterator(experiment_ids, info_only=True):
+                print(run_info.status)
+        """
+
+        yield from self._paginate(
+            lambda token: self.search_runs(
+                experiment_ids=experiment_ids,
+                query=query,
+                run_view_type=run_view_type,
+                max_results=max_results,
+                order_by=order_by,
+                page_token=token,
+                info_only=info_only,
+            ),
+            page_token,
         )
-        while True:
-            yield from page
-            if page.has_next_page:
-                page = self.search_runs(
-                    experiment_ids=experiment_ids,
-                    query=query,
-                    run_view_type=run_view_type,
-                    max_results=max_results,
-                    order_by=order_by,
-                    page_token=page.next_page_token,
-                )
-            else:
-                break
 
     def create_model(self, name: str, tags: TagsListOrDict | None = None) -> Model:
         """
@@ -1448,8 +1711,10 @@ class MLflowRESTClient:
             model = client.get_or_create_model("some_model", tags=tags)
         """
 
-        for model in self.search_models_iterator(f"name = '{name}'", max_results=1):
-            return model
+        # only the first page is needed, so iterator is not used to avoid fetching the next one
+        models = self.search_models(f"name = '{name}'", max_results=1)
+        if models:
+            return models[0]
         return self.create_model(name, tags=tags)
 
     def rename_model(self, name: str, new_name: str) -> Model:
@@ -1594,13 +1859,10 @@ class MLflowRESTClient:
                 print(model)
         """
 
-        page = self.list_models(max_results=max_results, page_token=page_token)
-        while True:
-            yield from page
-            if page.has_next_page:
-                page = self.list_models(max_results=max_results, page_token=page.next_page_token)
-            else:
-                break
+        yield from self._paginate(
+            lambda token: self.list_models(max_results=max_results, page_token=token),
+            page_token,
+        )
 
     def search_models(
         self,
@@ -1710,15 +1972,10 @@ class MLflowRESTClient:
                 print(model)
         """
 
-        page = self.search_models(query=query, max_results=max_results, order_by=order_by, page_token=page_token)
-        while True:
-            yield from page
-            if page.has_next_page:
-                page = self.search_models(
-                    query=query, max_results=max_results, order_by=order_by, page_token=page.next_page_token
-                )
-            else:
-                break
+        yield from self._paginate(
+            lambda token: self.search_models(query=query, max_results=max_results, order_by=order_by, page_token=token),
+            page_token,
+        )
 
     def set_model_tag(self, name: str, key: str, value: str) -> None:
         """
@@ -1797,15 +2054,9 @@ class MLflowRESTClient:
         """
 
         params: dict[str, Any] = {}
-        if stages:
-            stages_list: list[str]
-
-            if isinstance(stages, list):
-                stages_list = [ModelVersionStage(stage).value for stage in stages]
-            else:
-                stages_list = [ModelVersionStage(stages).value]
-
-            params["stages"] = stages_list
+        stages_list = self._handle_stages(stages)
+        if stages_list:
+            params["stages"] = [stage.value for stage in stages_list]
 
         response = self._get("registered-models/get-latest-versions", name=name, **params)
 
@@ -1879,7 +2130,8 @@ class MLflowRESTClient:
             )
         """
 
-        return parse_obj_as(ListableModelVersion, self.list_model_all_versions_iterator(name=name, stages=stages))
+        versions = list(self.list_model_all_versions_iterator(name=name, stages=stages))
+        return ListableModelVersion.construct(__root__=versions)
 
     # pylint: disable=broad-except
     def list_model_all_versions_iterator(
@@ -1916,15 +2168,10 @@ class MLflowRESTClient:
                 print(model_version)
         """
 
-        _stages: list[ModelVersionStage] = []
-        if stages:
-            if isinstance(stages, list):
-                _stages = [ModelVersionStage(stage) for stage in stages]
-            else:
-                _stages = [ModelVersionStage(stages)]
+        _stages = self._handle_stages(stages)
 
         max_version = -1
-        for version in self.list_model_versions_iterator(name, stages):
+        for version in self.list_model_versions_iterator(name, _stages):
             if version.version > max_version:
                 max_version = version.version
 
@@ -1988,17 +2235,13 @@ class MLflowRESTClient:
             model_version = client.create_model_version(name, tags=tags)
         """
 
-        params = {}
+        body = {"name": name, "tags": self._handle_tags(tags)}
         if source:
-            params["source"] = source
+            body["source"] = source
         if run_id:
-            params["run_id"] = UUID(str(run_id)).hex
-
-        tags_list = self._handle_tags(tags)
+            body["run_id"] = UUID(str(run_id)).hex
 
-        return ModelVersion.parse_obj(
-            self._post("model-versions/create", name=name, tags=tags_list, **params).get("model_version"),
-        )
+        return ModelVersion.parse_obj(self._post("model-versions/create", body).get("model_version"))
 
     def get_model_version(self, name: str, version: int) -> ModelVersion:
         """
@@ -2088,6 +2331,40 @@ class MLflowRESTClient:
 
         self._post("model-versions/set-tag", name=name, version=str(version), key=key, value=value)
 
+    def set_model_version_tags(self, name: str, version: int, tags: TagsListOrDict) -> None:
+        """
+        Set model version tags
+
+        Parameters
+        ----------
+        name : str
+            Model name
+
+        version: int
+            Version number
+
+        tags: :obj:`dict`, :obj:`list` of :obj:`dict`
+            Model version tags list
+
+        Examples
+        --------
+        .. code:: python
+
+            version_tags = {"some": "tag"}
+            # or
+            version_tags = [{"key": "some", "value": "tag"}]
+
+            client.set_model_version_tags("some_model", 1, version_tags)
+        """
+
+        tags_list = [tag if isinstance(tag, Tag) else Tag.parse_obj(tag) for tag in self._handle_tags(tags)]
+
+        # there is no endpoint for setting multiple model version tags, so send requests in parallel
+        self._map_concurrently(
+            lambda tag: self.set_model_version_tag(name, version, tag.key, tag.value),
+            tags_list,
+        )
+
     def delete_model_version_tag(self, name: str, version: int, key: str) -> None:
         """
         Delete model version tag
@@ -2242,17 +2519,15 @@ class MLflowRESTClient:
                 print(page)
         """
 
-        page = self.search_model_versions(
-            query=query, max_results=max_results, order_by=order_by, page_token=page_token
+        yield from self._paginate(
+            lambda token: self.search_model_versions(
+                query=query,
+                max_results=max_results,
+                order_by=order_by,
+                page_token=token,
+            ),
+            page_token,
         )
-        while True:
-            yield from page
-            if page.has_next_page:
-                page = self.search_model_versions(
-                    query=query, max_results=max_results, order_by=order_by, page_token=page.next_page_token
-                )
-            else:
-                break
 
     def get_model_version_download_url(self, name: str, version: int) -> str | None:
         """
@@ -2419,8 +2694,18 @@ class MLflowRESTClient:
         return self.transition_model_version_stage(name, version, stage=ModelVersionStage.ARCHIVED, **params)
 
     @staticmethod
-    def _handle_tags(tags: TagsListOrDict | None) -> list[dict[str, str]]:
-        result: list[dict[str, str]] = []
+    def _handle_stages(stages: ModelVersionStageOrList | None) -> list[ModelVersionStage]:
+        if not stages:
+            return []
+
+        if isinstance(stages, list):
+            return [ModelVersionStage(stage) for stage in stages]
+
+        return [ModelVersionStage(stages)]
+
+    @staticmethod
+    def _handle_tags(tags: TagsListOrDict | None) -> list[dict[str, Any]]:
+        result: list[dict[str, Any]] = []
 
         if not tags:
             return result
@@ -2439,44 +2724,95 @@ class MLflowRESTClient:
 
         return result
 
+    @staticmethod
+    def _paginate(get_page: Callable[[str | None], Page], page_token: str | None = None) -> Iterator:
+        page = get_page(page_token)
+        yield from page
+        if not page.has_next_page:
+            return
+
+        # consumer needs more than one page, so starting from the second one
+        # next page is requested in background while items of the current one are consumed
+        executor = ThreadPoolExecutor(max_workers=1)
+        next_page = None
+        try:
+            page = get_page(page.next_page_token)
+            while True:
+                next_page = executor.submit(get_page, page.next_page_token) if page.has_next_page else None
+                yield from page
+                if next_page is None:
+                    break
+                page = next_page.result()
+        finally:
+            # if consumer stopped the iteration, do not wait for the page which is not needed anymore
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown(wait=False)
+
+    def _map_concurrently(self, func: Callable[[Any], Any], items: list) -> list:
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _error_code(error: requests.HTTPError) -> str | None:
+        try:
+            return error.response.json().get("error_code")
+        except (AttributeError, ValueError):
+            return None
+
     def _url(self, path: str) -> str:
-        return f"{self._base_url}/api/2.0/preview/mlflow/{path}"
+        return self._api_url + path
 
     def _get(self, url: str, **query) -> dict:
         resp = self._request("get", url, params=query)
-        if not resp.text:
-            return {}
-
-        return resp.json()
+        return self._parse_response(resp)
 
-    def _post(self, url: str, **data) -> dict:
-        resp = self._request("post", url, json=data)
-        if not resp.text:
-            return {}
-
-        return resp.json()
+    def _post(self, url: str, body: dict | None = None, **data) -> dict:
+        # prebuilt body is sent as is, without packing it into kwargs and back
+        resp = self._request("post", url, json=data if body is None else body)
+        return self._parse_response(resp)
 
     def _patch(self, url: str, **data) -> dict:
         resp = self._request("patch", url, json=data)
-        if not resp.text:
+        return self._parse_response(resp)
+
+    @staticmethod
+    def _parse_response(resp: requests.Response) -> dict:
+        # raw bytes are parsed directly, resp.text would decode the whole body to str first
+        if not resp.content:
             return {}
 
-        return resp.json()
+        return _json_loads(resp.content)
 
     def _delete(self, url: str, **data) -> None:
-        self._request("delete", url, json=data)
+        # response body is not used, so there is no need to decode it even for logging
+        self._request("delete", url, log_response=False, json=data)
 
     # pylint: disable=logging-format-interpolation
     def _request(self, method: str, url: str, log_response: bool = True, **params) -> requests.Response:
         url = self._url(url)
-
-        log.debug(f"api_client.{method.upper()}: req: {params}")
-        log.debug(f"api_client.{method.upper()}: url: {url}")
-
-        resp = getattr(self._session, method)(url, **params)
+        method = method.upper()
+
+        # request body and response text can be large, so they are formatted only if debug logging is enabled
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug(f"api_client.{method}: req: {params}")
+            log.debug(f"api_client.{method}: url: {url}")
+
+        if "json" in params:
+            content = _json_dumps(params["json"])
+            if content is not None:
+                del params["json"]
+                params["data"] = content
+                params["headers"] = self.JSON_HEADERS
+
+        resp = self._session.request(method, url, **params)
         resp.raise_for_status()
 
-        if log_response:
-            log.debug(f"api_client.{method.upper()}: rsp: {resp.text}")
+        if debug and log_response and resp.content:
+            log.debug(f"api_client.{method}: rsp: {resp.text}")
 
         return resp
@@ -296,20 +296,18 @@ class ListableModelVersion(ListableBase):
 
     def __getitem__(self, item):
         if isinstance(item, ModelVersionStage):
-            res = {i.stage: i for i in self.__root__}
-            return res[item]
+            return self._index("stage")[item]
 
         if isinstance(item, str):
-            res = {i.name: i for i in self.__root__}
-            return res[item]
+            return self._index("name")[item]
 
         return self.__root__[item]
 
     def __contains__(self, item):
-        for itm in self.__root__:
-            if isinstance(item, ModelVersionStage) and item == itm.stage:
-                return True
+        if isinstance(item, ModelVersionStage):
+            return item in self._index("stage")
 
+        for itm in self.__root__:
             if (itm.name == item.name) and (itm.version == item.version):
                 return True
         return False
@@ -337,16 +335,12 @@ class ListableModel(ListableBase):
 
     def __getitem__(self, item):
         if isinstance(item, str):
-            res = {i.name: i for i in self.__root__}
-            return res[item]
+            return self._index("name")[item]
 
         return self.__root__[item]
 
     def __contains__(self, item):
         if isinstance(item, str):
-            res = [i.name for i in self.__root__]
-
-        if isinstance(item, Model):
-            res = self.__root__
+            return item in self._index("name")
 
-        return item in res
+        return item in self.__root__
@@ -31,6 +31,8 @@ class Page:
         model = Page(items=[Model(name="some_model")], next_page_token="some_token")
     """
 
+    __slots__ = ("items", "next_page_token", "_index")
+
     def __init__(self, items=None, next_page_token=None):
         self.items = items or []
         self.next_page_token = str(next_page_token) if next_page_token is not None else next_page_token
@@ -71,7 +73,8 @@ class Page:
             model = Page.make([ModelVersion(name="some_model", version=1)], name="another_model")
         """
 
-        items = inp.copy()
+        # items are always rebuilt below, so there is no need to copy the input
+        items = inp
         next_page_token = None
 
         if isinstance(inp, dict):
@@ -79,7 +82,11 @@ class Page:
             next_page_token = inp.get("next_page_token", None) or kwargs.pop("next_page_token", None)
 
         if item_class:
-            items = [item_class.parse_obj(item, **kwargs) for item in items]
+            parse_obj = item_class.parse_obj
+            if kwargs:
+                items = [parse_obj({**item, **kwargs}) if isinstance(item, dict) else parse_obj(item) for item in items]
+            else:
+                items = [parse_obj(item) for item in items]
 
             return cls(items=items, next_page_token=next_page_token)
 
@@ -113,12 +120,23 @@ class Page:
 
             other = self.make(other)
 
-        return repr(self) == repr(other)
+        if other is None:
+            return False
+
+        return (self.__class__.__name__, len(self.items), self.has_next_page) == (
+            other.__class__.__name__,
+            len(other.items),
+            other.has_next_page,
+        )
 
     def __getitem__(self, i):
         return self.items[i]
 
     def __getattr__(self, attr):
+        if attr in self.__slots__:
+            # slot is not set yet, e.g. while copying or unpickling
+            raise AttributeError(attr)
+
         return getattr(self.items, attr)
 
     def __add__(self, item):
@@ -11,10 +11,12 @@ from pydantic import (  # pylint: disable=no-name-in-module
     BaseModel,
     Field,
     root_validator,
+    validator,
 )
 
 from .internal import ListableBase, ListableTag
 from .tag import Tag
+from .timestamp import to_datetime
 
 RunId = Union[str, UUID]
 
@@ -64,6 +66,11 @@ class RunViewType(Enum):
     """ Show all runs """
 
 
+# runs are parsed in bulk from search responses, so avoid going through EnumMeta for each of them
+_RUN_STAGE_CACHE = {stage.value: stage for stage in RunStage}
+_RUN_STATUS_CACHE = {status.value: status for status in RunStatus}
+
+
 class RunInfo(BaseModel):
     """Run information representation
 
@@ -138,6 +145,53 @@ class RunInfo(BaseModel):
             values["id"] = values.get("run_id") or values.get("run_uuid")
         return values
 
+    @validator("status", pre=True)
+    def validate_status(cls, val):  # pylint: disable=no-self-argument
+        return _RUN_STATUS_CACHE.get(val, val)
+
+    @validator("stage", pre=True)
+    def validate_stage(cls, val):  # pylint: disable=no-self-argument
+        return _RUN_STAGE_CACHE.get(val, val)
+
+    @classmethod
+    def from_api(cls, data: dict) -> RunInfo:
+        """
+        Create run info from MLflow REST API response without running validation
+
+        Parameters
+        ----------
+        data : dict
+            Run info representation returned by MLflow REST API
+
+        Returns
+        -------
+        run_info : :obj:`RunInfo`
+            Run info
+
+        Examples
+        --------
+        .. code:: python
+
+            run_info = RunInfo.from_api({"run_id": "some_id", "status": "FINISHED"})
+        """
+
+        run_id = data.get("id") or data.get("run_id") or data.get("run_uuid")
+        experiment_id = data.get("experiment_id")
+        status = data.get("status")
+        stage = data.get("lifecycle_stage") or data.get("stage")
+        start_time = data.get("start_time")
+        end_time = data.get("end_time")
+
+        return cls.construct(
+            id=run_id if isinstance(run_id, UUID) else UUID(str(run_id)),
+            experiment_id=int(experiment_id) if experiment_id is not None else None,
+            status=(_RUN_STATUS_CACHE.get(status) or RunStatus(status)) if status else RunStatus.STARTED,
+            stage=(_RUN_STAGE_CACHE.get(stage) or RunStage(stage)) if stage else RunStage.ACTIVE,
+            start_time=to_datetime(start_time) if start_time is not None else None,
+            end_time=to_datetime(end_time) if end_time is not None else None,
+            artifact_uri=data.get("artifact_uri") or "",
+        )
+
     def __str__(self):
         return str(self.id)
 
@@ -150,21 +204,18 @@ class ListableRunInfo(ListableBase):
             item = UUID(item)
 
         if isinstance(item, UUID):
-            res = {i.id: i for i in self.__root__}
-            return res[item]
+            return self._index("id")[item]
 
         return self.__root__[item]
 
     def __contains__(self, item):
-        res = [i.id for i in self.__root__]
+        if isinstance(item, RunInfo):
+            return item in self.__root__
 
         if isinstance(item, str):
             item = UUID(str(item))
 
-        if isinstance(item, RunInfo):
-            res = self.__root__
-
-        return item in res
+        return item in self._index("id")
 
 
 class Param(Tag):
@@ -241,6 +292,38 @@ class Metric(BaseModel):
     step: int = 0
     timestamp: Optional[datetime] = None
 
+    @classmethod
+    def from_api(cls, data: dict) -> Metric:
+        """
+        Create metric from MLflow REST API response without running validation
+
+        Parameters
+        ----------
+        data : dict
+            Metric representation returned by MLflow REST API
+
+        Returns
+        -------
+        metric : :obj:`Metric`
+            Metric
+
+        Examples
+        --------
+        .. code:: python
+
+            metric = Metric.from_api({"key": "some.metric", "value": 1.23, "step": 2})
+        """
+
+        value = data.get("value")
+        timestamp = data.get("timestamp")
+
+        return cls.construct(
+            key=data["key"],
+            value=float(value) if value is not None else None,
+            step=int(data.get("step") or 0),
+            timestamp=to_datetime(timestamp) if timestamp is not None else None,
+        )
+
     def __str__(self):
         return str(f"{self.key}: {self.value} for {self.step} at {self.timestamp}")
 
@@ -323,6 +406,38 @@ class RunData(BaseModel):
     class Config:
         frozen = True
 
+    @classmethod
+    def from_api(cls, data: dict) -> RunData:
+        """
+        Create run data from MLflow REST API response without running validation
+
+        Parameters
+        ----------
+        data : dict
+            Run data representation returned by MLflow REST API
+
+        Returns
+        -------
+        run_data : :obj:`RunData`
+            Run data
+
+        Examples
+        --------
+        .. code:: python
+
+            run_data = RunData.from_api({"params": [{"key": "some.param", "value": "some_value"}]})
+        """
+
+        params = [Param.construct(key=item["key"], value=item.get("value", "")) for item in data.get("params") or []]
+        metrics = [Metric.from_api(item) for item in data.get("metrics") or []]
+        tags = [Tag.construct(key=item["key"], value=item.get("value", "")) for item in data.get("tags") or []]
+
+        return cls.construct(
+            params=ListableParam.construct(__root__=params),
+            metrics=ListableMetric.construct(__root__=metrics),
+            tags=ListableTag.construct(__root__=tags),
+        )
+
 
 class Run(BaseModel):
     """Run representation
@@ -359,6 +474,33 @@ class Run(BaseModel):
     class Config:
         frozen = True
 
+    @classmethod
+    def from_api(cls, data: dict) -> Run:
+        """
+        Create run from MLflow REST API response without running validation
+
+        Response is trusted to match MLflow schema, so fields are converted manually
+        and the model is built with ``construct``, which is much faster than ``parse_obj``.
+
+        Parameters
+        ----------
+        data : dict
+            Run representation returned by MLflow REST API
+
+        Returns
+        -------
+        run : :obj:`Run`
+            Run
+
+        Examples
+        --------
+        .. code:: python
+
+            run = Run.from_api({"info": {"run_id": "some_id"}, "data": {"metrics": [...]}})
+        """
+
+        return cls.construct(info=RunInfo.from_api(data["info"]), data=RunData.from_api(data.get("data") or {}))
+
     def __str__(self) -> str:
         return str(self.info)
 
@@ -372,6 +514,8 @@ class Run(BaseModel):
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, Run):
-            return self.info.dict() == other.info.dict()
+            # RunInfo contains only scalar fields, so comparing them directly is enough
+            # and avoids building two dicts on every comparison
+            return self.info.__dict__ == other.info.__dict__
 
         return super().__eq__(other)
@@ -4,10 +4,17 @@ from __future__ import annotations
 
 import datetime
 from enum import Enum
-from typing import Union
+from typing import Any, Union
+
+from pydantic.datetime_parse import parse_datetime  # pylint: disable=no-name-in-module
 
 AnyTimestamp = Union[int, datetime.datetime, None]
 
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# pydantic treats numbers above this value as milliseconds
+_MS_WATERSHED = int(2e10)
+
 
 class Unit(Enum):
     MSEC = 1000
@@ -39,6 +46,19 @@ def timestamp_2_time(timestamp: AnyTimestamp) -> datetime.datetime | None:
     return None
 
 
+def to_datetime(value: Any) -> datetime.datetime:
+    """Same as pydantic datetime parsing, but with fast path for UNIX timestamps returned by MLflow."""
+
+    if type(value) is int:  # pylint: disable=unidiomatic-typecheck
+        if abs(value) <= _MS_WATERSHED:
+            return _EPOCH + datetime.timedelta(seconds=value)
+        if abs(value) <= _MS_WATERSHED * 1000:
+            # same float division as pydantic, to get exactly the same rounding
+            return _EPOCH + datetime.timedelta(seconds=value / 1000)
+
+    return parse_datetime(value)
+
+
 def format_to_timestamp(data: AnyTimestamp = None) -> int:
     """Any object (str, int, datetime formatting to timestamp."""
 
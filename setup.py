@@ -52,6 +52,9 @@ setup(
     packages=find_packages(exclude=["docs", "docs.*", "tests", "tests.*", "samples", "samples.*"]),
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "orjson": ["orjson"],
+    },
     setup_requires=["setuptools-git-versioning>=1.8.1"],
     test_suite="tests",
     include_package_data=True,
@@ -7,6 +7,7 @@ from uuid import uuid4
 import pytest
 from requests import HTTPError
 
+from mlflow_rest_client import MLflowRESTClient
 from mlflow_rest_client.experiment import ExperimentStage
 from mlflow_rest_client.model import ModelVersionStage
 from mlflow_rest_client.run import Metric, RunStage, RunStatus
@@ -25,6 +26,14 @@ log = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 60
 
 
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_client_with_pool_maxsize(client, create_experiment):
+    exp = create_experiment
+
+    with MLflowRESTClient(client._base_url, pool_maxsize=1) as small_client:
+        assert small_client.get_experiment(exp.id) == exp
+
+
 @pytest.mark.timeout(DEFAULT_TIMEOUT)
 def test_list_experiments(client, create_experiment):
     exp = create_experiment
@@ -44,6 +53,15 @@ def test_list_experiments_iterator(client, create_experiment):
     assert created
 
 
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_list_experiments_iterator_paginated(client, create_experiment):
+    exp = create_experiment
+
+    names = [item.name for item in client.list_experiments_iterator(max_results=1)]
+    assert exp.name in names
+    assert len(names) == len(set(names))
+
+
 @pytest.mark.timeout(DEFAULT_TIMEOUT)
 def test_get_experiment(client, create_experiment):
     exp = create_experiment
@@ -475,6 +493,33 @@ def test_log_run_metrics(create_run, client):
         assert int(run.metrics[key].timestamp.timestamp()) == int(timestamp.timestamp())
 
 
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch(create_run, client):
+    param_key = rand_str()
+    param_value = rand_str()
+    metric_key = rand_str()
+    metric_value = rand_float()
+    tag_key = rand_str()
+    tag_value = rand_str()
+
+    run = create_run
+    with client.run_batch(run.id) as batch:
+        batch.log_parameter(param_key, param_value)
+        batch.log_metric(metric_key, metric_value, step=1)
+        batch.set_tag(tag_key, tag_value)
+
+        run = client.get_run(run.id)
+        assert param_key not in run.params
+        assert metric_key not in run.metrics
+        assert tag_key not in run.tags
+
+    run = client.get_run(run.id)
+    assert run.params[param_key].value == param_value
+    assert run.metrics[metric_key].value == pytest.approx(metric_value)
+    assert run.metrics[metric_key].step == 1
+    assert run.tags[tag_key].value == tag_value
+
+
 @pytest.mark.timeout(DEFAULT_TIMEOUT)
 def test_set_run_tag(create_run, client):
     key = rand_str()
@@ -582,6 +627,18 @@ def test_list_run_metric_history_iterator(create_run, client):
         assert found.timestamp.date() == metric.timestamp.date()
 
 
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_list_run_metric_history_iterator_paginated(create_run, client):
+    key = rand_str()
+    values = [{"key": key, "value": rand_float(), "step": i} for i in range(1, 6)]
+
+    run = create_run
+    client.log_run_metrics(run.id, values)
+
+    steps = [metric.step for metric in client.list_run_metric_history_iterator(run.id, key, max_results=2)]
+    assert sorted(steps) == [value["step"] for value in values]
+
+
 @pytest.mark.timeout(DEFAULT_TIMEOUT)
 def test_list_run_artifacts(create_run, client):
     run = create_run
@@ -607,6 +664,14 @@ def test_search_runs(create_run, client):
     assert run in runs
 
 
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_search_runs_info_only(create_run, client):
+    run = create_run
+
+    run_infos = client.search_runs(experiment_ids=[run.experiment_id], info_only=True)
+    assert run.info in run_infos
+
+
 @pytest.mark.timeout(DEFAULT_TIMEOUT)
 def test_search_runs_iterator(create_run, client):
     timestamp = now()
@@ -1195,6 +1260,18 @@ def test_set_model_version_tag(client, create_model_version):
     assert new_version.tags[key].value == value
 
 
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_set_model_version_tags(client, create_model_version):
+    tags = {rand_str(): rand_str() for _ in range(3)}
+
+    version = create_model_version
+    client.set_model_version_tags(version.name, version.version, tags)
+
+    new_version = client.get_model_version(version.name, version.version)
+    for key, value in tags.items():
+        assert new_version.tags[key].value == value
+
+
 @pytest.mark.timeout(DEFAULT_TIMEOUT)
 def test_delete_model_version_tag(client, create_model_version):
     key = rand_str()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from mlflow_rest_client.artifact import Artifact
+
+from .conftest import DEFAULT_TIMEOUT, rand_int, rand_str
+
+log = logging.getLogger(__name__)
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_artifact_str():
+    path = rand_str()
+
+    artifact = Artifact(path=path, file_size=rand_int())
+
+    assert str(artifact) == path
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_artifact_str_with_root():
+    path = rand_str()
+    root = f"s3://{rand_str()}/{rand_str()}"
+
+    artifact = Artifact(path=path, file_size=rand_int(), root=root)
+
+    assert str(artifact) == f"{root}/{path}"
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_artifact_hash():
+    path = rand_str()
+    file_size = rand_int()
+
+    artifact1 = Artifact(path=path, file_size=file_size)
+    artifact2 = Artifact(path=path, file_size=file_size)
+
+    assert artifact1 == artifact2
+    assert hash(artifact1) == hash(artifact2)
+    assert hash(artifact1) == hash(artifact1)
+    assert len({artifact1, artifact2}) == 1
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_artifact_eq():
+    path1 = rand_str()
+    path2 = rand_str()
+    file_size = rand_int()
+
+    assert Artifact(path=path1, file_size=file_size) != Artifact(path=path2, file_size=file_size)
+    assert Artifact(path=path1, file_size=file_size).dict() == {
+        "path": Artifact(path=path1, file_size=file_size).path,
+        "file_size": file_size,
+        "root": None,
+        "is_dir": False,
+    }
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_artifact_full_path():
+    path = rand_str()
+    root = f"s3://{rand_str()}/{rand_str()}"
+
+    artifact = Artifact(path=path, file_size=rand_int(), root=root)
+
+    assert artifact.full_path == f"{root}/{path}"
+    assert artifact.full_path is artifact.full_path
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_artifact_full_path_root_with_trailing_slash():
+    path = rand_str()
+    root = f"s3://{rand_str()}/{rand_str()}"
+
+    artifact = Artifact(path=path, file_size=rand_int(), root=root + "/")
+
+    assert artifact.full_path == f"{root}/{path}"
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize("root", [None, "s3://some/root"])
+def test_artifact_from_api(root):
+    dct = {"path": f"{rand_str()}/{rand_str()}", "file_size": str(rand_int()), "is_dir": True}
+
+    artifact = Artifact.from_api(dct, root=root)
+
+    assert artifact == Artifact.parse_obj({**dct, "root": root})
+    assert hash(artifact) == hash(Artifact.parse_obj({**dct, "root": root}))
+    assert str(artifact) == str(Artifact.parse_obj({**dct, "root": root}))
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_artifact_from_api_without_file_size():
+    dct = {"path": rand_str(), "is_dir": True}
+
+    with pytest.raises(ValueError):
+        Artifact.from_api(dct, root="s3://some/root")
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize("root", [None, "s3://some/root"])
+def test_artifact_copy_with_update(root):
+    path1 = rand_str()
+    path2 = rand_str()
+    file_size = rand_int()
+
+    artifact = Artifact(path=path1, file_size=file_size, root=root)
+    # fill up cached values
+    assert path1 in str(artifact)
+    assert artifact.full_path
+    hash(artifact)
+
+    copied = artifact.copy(update={"path": Path(path2)})
+    expected = Artifact(path=path2, file_size=file_size, root=root)
+
+    assert str(copied) == str(expected)
+    assert copied.full_path == expected.full_path
+    assert hash(copied) == hash(expected)
+    assert copied in {expected}
+
+    assert str(artifact.copy()) == str(artifact)
+    assert hash(artifact.copy()) == hash(artifact)
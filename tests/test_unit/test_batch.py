@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import logging
+import time
+from uuid import uuid4
+
+import pytest
+
+from mlflow_rest_client.batch import RunBatch
+
+from .conftest import DEFAULT_TIMEOUT, now, rand_float, rand_int, rand_str
+
+log = logging.getLogger(__name__)
+
+
+class FakeClient:
+    def __init__(self):
+        self.batches = []
+
+    def log_run_batch(self, run_id, params=None, metrics=None, tags=None):
+        self.batches.append({"run_id": run_id, "params": list(params), "metrics": list(metrics), "tags": list(tags)})
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_flush():
+    client = FakeClient()
+    run_id = uuid4()
+
+    param_key = rand_str()
+    param_value = rand_str()
+    metric_key = rand_str()
+    metric_value = rand_float()
+    step = rand_int()
+    timestamp = now()
+    tag_key = rand_str()
+    tag_value = rand_str()
+
+    batch = RunBatch(client, run_id)
+    batch.log_parameter(param_key, param_value)
+    batch.log_metric(metric_key, metric_value, step=step, timestamp=timestamp)
+    batch.set_tag(tag_key, tag_value)
+
+    assert len(batch) == 3
+    assert not client.batches
+
+    batch.flush()
+
+    assert len(batch) == 0
+    assert client.batches == [
+        {
+            "run_id": run_id,
+            "params": [{"key": param_key, "value": param_value}],
+            "metrics": [
+                {"key": metric_key, "value": metric_value, "step": step, "timestamp": int(timestamp.timestamp())}
+            ],
+            "tags": [{"key": tag_key, "value": tag_value}],
+        }
+    ]
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_flush_empty():
+    client = FakeClient()
+
+    batch = RunBatch(client, uuid4())
+    batch.flush()
+
+    assert not client.batches
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_context_manager():
+    client = FakeClient()
+
+    with RunBatch(client, uuid4()) as batch:
+        batch.log_metric(rand_str(), rand_float())
+        assert not client.batches
+
+    assert len(client.batches) == 1
+    assert len(client.batches[0]["metrics"]) == 1
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize(
+    "method, limit",
+    [
+        ("log_parameter", RunBatch.MAX_PARAMS),
+        ("set_tag", RunBatch.MAX_TAGS),
+    ],
+)
+def test_run_batch_flush_on_limit(method, limit):
+    client = FakeClient()
+
+    batch = RunBatch(client, uuid4())
+    for _ in range(limit + 1):
+        getattr(batch, method)(rand_str(), rand_str())
+
+    assert len(client.batches) == 1
+    assert len(batch) == 1
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_flush_on_total_limit():
+    client = FakeClient()
+
+    batch = RunBatch(client, uuid4())
+    for _ in range(RunBatch.MAX_TAGS - 1):
+        batch.set_tag(rand_str(), rand_str())
+    for _ in range(RunBatch.MAX_ENTITIES - RunBatch.MAX_TAGS + 1):
+        batch.log_metric(rand_str(), rand_float())
+
+    assert len(client.batches) == 1
+    assert len(batch) == 0
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_keeps_values_on_error():
+    class FailingClient:
+        def log_run_batch(self, *args, **kwargs):
+            raise RuntimeError
+
+    batch = RunBatch(FailingClient(), uuid4())
+    batch.log_metric(rand_str(), rand_float())
+
+    with pytest.raises(RuntimeError):
+        batch.flush()
+
+    assert len(batch) == 1
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_recovers_after_failed_flush():
+    class FlakyClient(FakeClient):
+        def __init__(self):
+            super().__init__()
+            self.failures = 1
+
+        def log_run_batch(self, run_id, params=None, metrics=None, tags=None):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError
+            super().log_run_batch(run_id, params=params, metrics=metrics, tags=tags)
+
+    client = FlakyClient()
+
+    batch = RunBatch(client, uuid4())
+    for _ in range(RunBatch.MAX_METRICS - 1):
+        batch.log_metric(rand_str(), rand_float())
+
+    # buffer is full, but request failed
+    with pytest.raises(RuntimeError):
+        batch.log_metric(rand_str(), rand_float())
+
+    assert len(batch) == RunBatch.MAX_METRICS
+
+    # next value is added to the buffer, and it is sent without exceeding MLflow limits
+    batch.log_metric(rand_str(), rand_float())
+
+    assert len(batch) == 0
+    assert [len(item["metrics"]) for item in client.batches] == [RunBatch.MAX_METRICS, 1]
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_flush_respects_limits():
+    client = FakeClient()
+
+    batch = RunBatch(client, uuid4())
+    # bypass automatic flush to get a buffer larger than MLflow limits, like after failed requests
+    batch._params = {str(i): {"key": str(i), "value": rand_str()} for i in range(RunBatch.MAX_PARAMS + 1)}
+    batch._metrics = [{"key": rand_str(), "value": rand_float()} for _ in range(RunBatch.MAX_METRICS + 1)]
+    batch._tags = [{"key": rand_str(), "value": rand_str()} for _ in range(RunBatch.MAX_TAGS + 1)]
+
+    batch.flush()
+
+    assert len(batch) == 0
+    for item in client.batches:
+        assert len(item["params"]) <= RunBatch.MAX_PARAMS
+        assert len(item["metrics"]) <= RunBatch.MAX_METRICS
+        assert len(item["tags"]) <= RunBatch.MAX_TAGS
+        assert len(item["params"]) + len(item["metrics"]) + len(item["tags"]) <= RunBatch.MAX_ENTITIES
+
+    assert sum(len(item["params"]) for item in client.batches) == RunBatch.MAX_PARAMS + 1
+    assert sum(len(item["metrics"]) for item in client.batches) == RunBatch.MAX_METRICS + 1
+    assert sum(len(item["tags"]) for item in client.batches) == RunBatch.MAX_TAGS + 1
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_param_last_value_wins():
+    client = FakeClient()
+    key = rand_str()
+    value = rand_str()
+
+    with RunBatch(client, uuid4()) as batch:
+        batch.log_parameter(key, rand_str())
+        batch.log_parameter(key, value)
+
+        assert len(batch) == 1
+
+    assert client.batches[0]["params"] == [{"key": key, "value": value}]
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_empty_is_truthy():
+    batch = RunBatch(FakeClient(), uuid4())
+
+    assert len(batch) == 0
+    assert batch
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("log_parameter", (rand_str(), rand_str())),
+        ("log_metric", (rand_str(), rand_float())),
+        ("set_tag", (rand_str(), rand_str())),
+    ],
+)
+def test_run_batch_closed(method, args):
+    client = FakeClient()
+
+    batch = RunBatch(client, uuid4())
+    batch.close()
+
+    with pytest.raises(RuntimeError):
+        getattr(batch, method)(*args)
+
+    assert len(batch) == 0
+    assert not client.batches
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_context_manager_keeps_original_error():
+    class FailingClient:
+        def log_run_batch(self, *args, **kwargs):
+            raise RuntimeError
+
+    with pytest.raises(ValueError):
+        with RunBatch(FailingClient(), uuid4()) as batch:
+            batch.log_metric(rand_str(), rand_float())
+            raise ValueError
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_context_manager_flushes_on_error():
+    client = FakeClient()
+
+    with pytest.raises(ValueError):
+        with RunBatch(client, uuid4()) as batch:
+            batch.log_metric(rand_str(), rand_float())
+            raise ValueError
+
+    assert len(client.batches) == 1
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_flush_interval():
+    client = FakeClient()
+
+    with RunBatch(client, uuid4(), flush_interval=0.01) as batch:
+        batch.log_metric(rand_str(), rand_float())
+
+        for _ in range(100):
+            if client.batches:
+                break
+            time.sleep(0.01)
+
+        assert len(client.batches) == 1
+        assert len(batch) == 0
+
+    assert len(client.batches) == 1
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_flush_interval_recovers_after_error(caplog):
+    class FlakyClient(FakeClient):
+        def __init__(self):
+            super().__init__()
+            self.failures = 2
+
+        def log_run_batch(self, run_id, params=None, metrics=None, tags=None):
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError
+            super().log_run_batch(run_id, params=params, metrics=metrics, tags=tags)
+
+    client = FlakyClient()
+
+    batch = RunBatch(client, uuid4(), flush_interval=0.01)
+    # buffer larger than MLflow limits should not block background flush forever
+    with batch._lock:
+        batch._metrics.extend({"key": rand_str(), "value": rand_float()} for _ in range(RunBatch.MAX_METRICS + 1))
+
+    for _ in range(100):
+        if len(batch) == 0:
+            break
+        time.sleep(0.01)
+
+    assert len(batch) == 0
+
+    # values were sent, but caller is notified about background flush failure
+    with pytest.raises(RuntimeError):
+        batch.close()
+
+    assert not client.failures
+    assert "Cannot flush batch" in caplog.text
+    assert [len(item["metrics"]) for item in client.batches] == [RunBatch.MAX_METRICS, 1]
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_batch_close_stops_flush_thread():
+    client = FakeClient()
+
+    batch = RunBatch(client, uuid4(), flush_interval=60)
+    batch.set_tag(rand_str(), rand_str())
+    batch.close()
+
+    assert len(client.batches) == 1
+    assert not batch._flush_thread.is_alive()
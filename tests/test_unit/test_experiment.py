@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from mlflow_rest_client.experiment import Experiment, ExperimentStage, ExperimentTag
+
+from .conftest import DEFAULT_TIMEOUT, rand_int, rand_str
+
+log = logging.getLogger(__name__)
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_experiment():
+    experiment_id = rand_int()
+    name = rand_str()
+
+    experiment = Experiment(experiment_id=experiment_id, name=name)
+
+    assert experiment.id == experiment_id
+    assert experiment.name == name
+    assert experiment.stage == ExperimentStage.ACTIVE
+    assert str(experiment) == name
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize("stage", [ExperimentStage.ACTIVE, ExperimentStage.DELETED])
+def test_experiment_with_stage(stage):
+    experiment_id = rand_int()
+    name = rand_str()
+
+    assert Experiment(experiment_id=experiment_id, name=name, lifecycle_stage=stage).stage == stage
+    assert Experiment(experiment_id=experiment_id, name=name, lifecycle_stage=stage.value).stage == stage
+    assert Experiment(experiment_id=experiment_id, name=name, lifecycle_stage=stage.value.upper()).stage == stage
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_experiment_with_empty_stage():
+    experiment = Experiment(experiment_id=rand_int(), name=rand_str(), lifecycle_stage=None)
+
+    assert experiment.stage == ExperimentStage.ACTIVE
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize("stage", [ExperimentStage.ACTIVE, ExperimentStage.DELETED])
+def test_experiment_from_api(stage):
+    key = rand_str()
+    value = rand_str()
+
+    dct = {
+        "experiment_id": str(rand_int()),
+        "name": rand_str(),
+        "artifact_location": rand_str(),
+        "lifecycle_stage": stage.value,
+        "tags": [{"key": key, "value": value}],
+    }
+
+    experiment = Experiment.from_api(dct)
+
+    assert experiment == Experiment.parse_obj(dct)
+    assert experiment.id == int(dct["experiment_id"])
+    assert experiment.stage == stage
+    assert experiment.tags[key] == ExperimentTag(key=key, value=value)
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_experiment_from_api_without_optional_fields():
+    dct = {"experiment_id": str(rand_int()), "name": rand_str()}
+
+    experiment = Experiment.from_api(dct)
+
+    assert experiment == Experiment.parse_obj(dct)
+    assert experiment.artifact_location == ""
+    assert experiment.stage == ExperimentStage.ACTIVE
+    assert not experiment.tags
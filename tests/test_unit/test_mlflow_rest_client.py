@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from enum import IntEnum
+
+import pytest
+
+from mlflow_rest_client import MLflowRESTClient
+from mlflow_rest_client import mlflow_rest_client as client_module
+from mlflow_rest_client.mlflow_rest_client import _json_dumps, _json_loads
+from mlflow_rest_client.page import Page
+
+from .conftest import DEFAULT_TIMEOUT, rand_int
+
+log = logging.getLogger(__name__)
+
+
+class FakePages:
+    def __init__(self, pages_count: int, page_size: int = 3, release: threading.Event | None = None):
+        self.pages_count = pages_count
+        self.page_size = page_size
+        # if set, pages after the second one (i.e. prefetched ones) are not returned until event is set
+        self.release = release
+        self.requested: list[str | None] = []
+
+    def __call__(self, page_token: str | None) -> Page:
+        self.requested.append(page_token)
+        number = int(page_token) if page_token else 0
+        if self.release is not None and number > 1:
+            self.release.wait()
+
+        items = list(range(number * self.page_size, (number + 1) * self.page_size))
+        next_page_token = str(number + 1) if number + 1 < self.pages_count else None
+        return Page(items=items, next_page_token=next_page_token)
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize("pages_count", [1, 2, 5])
+def test_paginate(pages_count):
+    get_page = FakePages(pages_count)
+
+    items = list(MLflowRESTClient._paginate(get_page))
+
+    assert items == list(range(pages_count * get_page.page_size))
+    assert get_page.requested == [None] + [str(i) for i in range(1, pages_count)]
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_paginate_with_page_token():
+    get_page = FakePages(5)
+
+    items = list(MLflowRESTClient._paginate(get_page, page_token="3"))
+
+    assert items == list(range(3 * get_page.page_size, 5 * get_page.page_size))
+    assert get_page.requested == ["3", "4"]
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_paginate_stop_on_first_page():
+    get_page = FakePages(5)
+
+    iterator = MLflowRESTClient._paginate(get_page)
+    assert next(iterator) == 0
+    iterator.close()
+
+    # next page is not requested until consumer reaches it
+    assert get_page.requested == [None]
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_paginate_stop_does_not_wait_for_prefetch():
+    release = threading.Event()
+    get_page = FakePages(5, release=release)
+
+    iterator = MLflowRESTClient._paginate(get_page)
+    for _ in range(get_page.page_size + 1):
+        next(iterator)
+
+    # prefetch of third page is blocked until the event is set, so closing would hang if it waited for it
+    iterator.close()
+
+    assert not release.is_set()
+    release.set()
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_paginate_prefetch():
+    pages_count = rand_int(3, 5)
+    get_page = FakePages(pages_count)
+    prefetched = threading.Event()
+
+    def get_page_with_event(page_token):
+        page = get_page(page_token)
+        if page_token == "2":
+            prefetched.set()
+        return page
+
+    iterator = MLflowRESTClient._paginate(get_page_with_event)
+    for _ in range(get_page.page_size + 1):
+        next(iterator)
+
+    # third page is requested while the second one is consumed
+    assert prefetched.wait(DEFAULT_TIMEOUT)
+    assert list(iterator) == list(range(get_page.page_size + 1, pages_count * get_page.page_size))
+
+
+class SomeIntEnum(IntEnum):
+    VALUE = 1
+
+
+@dataclass
+class SomeDataclass:
+    value: int
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        [],
+        {"key": "value", "number": 1, "float": 0.5, "bool": True, "none": None},
+        {"nested": [{"key": "value"}, (1, 2, 3)], "unicode": "значение", "int_enum": SomeIntEnum.VALUE},
+        {"run_id": "some_id", "key": "some.metric", "value": 0.5, "step": 0},
+        {"run_id": "some_id", "metrics": [{"key": "some.metric", "value": 1, "step": 0}], "tags": []},
+    ],
+)
+def test_json_dumps(body):
+    content = _json_dumps(body)
+
+    assert isinstance(content, bytes)
+    assert json.loads(content) == json.loads(json.dumps(body))
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+@pytest.mark.parametrize(
+    "wrap",
+    [
+        lambda value: {"run_id": "some_id", "key": "some.metric", "value": value},
+        lambda value: {"run_id": "some_id", "metrics": [{"key": "some.metric", "value": 0.5}, {"value": value}]},
+    ],
+)
+def test_json_dumps_non_finite_metric(value, wrap):
+    # body is left to requests, so it fails in the same way with and without orjson
+    assert _json_dumps(wrap(value)) is None
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime.now(),
+        SomeDataclass(1),
+        {1: "non-string key"},
+        object(),
+    ],
+)
+def test_json_dumps_unsupported_type(value):
+    # types not supported by stdlib json are not serialized by orjson in a different way
+    assert _json_dumps({"key": [{"nested": value}]}) is None
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_json_dumps_without_orjson(monkeypatch):
+    monkeypatch.setattr(client_module, "orjson", None)
+
+    assert _json_dumps({"key": "value"}) is None
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (b"{}", {}),
+        (b'{"key": "value", "list": [1, 0.5, null, true]}', {"key": "value", "list": [1, 0.5, None, True]}),
+        ('{"unicode": "значение"}'.encode("utf-8"), {"unicode": "значение"}),
+    ],
+)
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_json_loads(content, expected, with_orjson, monkeypatch):
+    if not with_orjson:
+        monkeypatch.setattr(client_module, "orjson", None)
+
+    assert _json_loads(content) == expected
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_json_loads_nan(with_orjson, monkeypatch):
+    if not with_orjson:
+        monkeypatch.setattr(client_module, "orjson", None)
+
+    result = _json_loads(b'{"nan": NaN, "inf": Infinity, "-inf": -Infinity}')
+
+    assert math.isnan(result["nan"])
+    assert result["inf"] == math.inf
+    assert result["-inf"] == -math.inf
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_log_run_batch_metric_timestamps(monkeypatch):
+    client = MLflowRESTClient("http://localhost")
+    bodies = []
+    monkeypatch.setattr(client, "_post", lambda url, body: bodies.append(body))
+
+    now = datetime.now()
+    default = rand_int(1000000000, 1500000000)
+    timestamp = rand_int(1000000000, 1500000000)
+    metrics = [
+        {"key": "int", "value": 1, "timestamp": timestamp},
+        {"key": "datetime", "value": 2, "timestamp": now},
+        {"key": "float", "value": 3, "timestamp": timestamp + 0.5},
+        {"key": "missing", "value": 4},
+    ]
+
+    client.log_run_batch("0" * 32, metrics=metrics, timestamp=default)
+
+    sent = {metric["key"]: metric["timestamp"] for metric in bodies[0]["metrics"]}
+    assert sent == {"int": timestamp, "datetime": int(now.timestamp()), "float": timestamp, "missing": default}
+    # metrics passed by user are not modified
+    assert metrics[1]["timestamp"] == now
+    assert "timestamp" not in metrics[3]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import copy
 import logging
 
 import pytest
 
+from mlflow_rest_client.artifact import Artifact
 from mlflow_rest_client.page import Page
 
 from .conftest import DEFAULT_TIMEOUT, rand_str
@@ -177,3 +179,27 @@ def test_page_iterator():
 
     assert found_item1
     assert found_item2
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_page_copy():
+    items = [rand_str()]
+    next_page_token = rand_str()
+
+    page = Page(items, next_page_token=next_page_token)
+    page_copy = copy.copy(page)
+
+    assert page_copy.items == items
+    assert page_copy.next_page_token == next_page_token
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_page_make_dict_with_item_class():
+    path = rand_str()
+    root = f"s3://{rand_str()}/{rand_str()}"
+    dct = {"files": [{"path": path, "file_size": 1}], "next_page_token": rand_str()}
+
+    page = Page.make(dct, items_key="files", item_class=Artifact, root=root)
+
+    assert page.items == [Artifact(path=path, file_size=1, root=root)]
+    assert page.next_page_token == dct["next_page_token"]
@@ -731,6 +731,44 @@ def test_run_make_dict():
     assert run.data == run_data
 
 
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+@pytest.mark.parametrize("timestamp", [1700000000, 1700000000123])
+def test_run_from_api(timestamp):
+    dct = {
+        "info": {
+            "run_id": uuid4().hex,
+            "experiment_id": str(rand_int()),
+            "status": RunStatus.FINISHED.value,
+            "lifecycle_stage": RunStage.DELETED.value,
+            "start_time": timestamp,
+            "end_time": timestamp + 1,
+            "artifact_uri": rand_str(),
+        },
+        "data": {
+            "params": [{"key": rand_str(), "value": rand_str()}],
+            "metrics": [{"key": rand_str(), "value": rand_float(), "step": rand_int(), "timestamp": timestamp}],
+            "tags": [{"key": rand_str(), "value": rand_str()}],
+        },
+    }
+
+    run = Run.from_api(dct)
+
+    assert run.dict() == Run.parse_obj(dct).dict()
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_run_from_api_without_optional_fields():
+    dct = {"info": {"run_uuid": str(uuid4())}}
+
+    run = Run.from_api(dct)
+
+    assert run.dict() == Run.parse_obj(dct).dict()
+    assert run.status == RunStatus.STARTED
+    assert run.stage == RunStage.ACTIVE
+    assert run.start_time is None
+    assert not run.metrics
+
+
 @pytest.mark.timeout(DEFAULT_TIMEOUT)
 def test_run_str():
     id = uuid4()
@@ -4,6 +4,7 @@ import logging
 
 import pytest
 
+from mlflow_rest_client.internal import ListableTag
 from mlflow_rest_client.tag import Tag
 
 from .conftest import DEFAULT_TIMEOUT, rand_str
@@ -67,3 +68,25 @@ def test_tag_eq_str():
 
     assert Tag(key=key1, value=value1).key == key1
     assert Tag(key=key1, value=value1).key != key2
+
+
+@pytest.mark.timeout(DEFAULT_TIMEOUT)
+def test_listable_tag_copy():
+    key1 = rand_str()
+    key2 = rand_str()
+
+    tags = ListableTag.parse_obj([Tag(key=key1)])
+    # fill up index
+    assert key1 in tags
+
+    empty = tags.copy(update={"__root__": []})
+    assert key1 not in empty
+    assert not empty.as_dict
+
+    other = tags.copy(update={"__root__": [Tag(key=key2)]})
+    assert key1 not in other
+    assert other[key2] == Tag(key=key2)
+
+    copied = tags.copy()
+    assert key1 in copied
+    assert copied._indexes is not tags._indexes